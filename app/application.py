@@ -1,3 +1,4 @@
+from typing import Optional
 from .logger import Logger
 from config.settings import Config
 from db.engine import DbEngine
@@ -6,6 +7,7 @@ from app.clients.nbp_api_client import NBPApiClient
 from app.loaders.csv_loader import CSVRateLoader
 from app.services.exchange_rate_saver import ExchangeRateSaver
 from app.services.exchange_rate_manager import ExchangeRateManager
+from app.profiler import StageProfiler
 
 
 class Application:
@@ -31,31 +33,79 @@ class Application:
             saver=self.saver
         )
 
-    def run_daily_only(self, start_date: str, end_date: str):
+    def run_daily_only(self, start_date: str, end_date: str, profile: Optional[bool] = None):
         """
         Uruchamia synchronizację tylko kursów dziennych.
         """
-        self.manager.sync_daily_rates(start_date, end_date)
+        self._start_profiling(profile)
+        try:
+            self.manager.run_stage("daily", self.manager.sync_daily_rates, start_date, end_date)
+        finally:
+            self._finish_profiling()
 
-    def run_monthly_only(self, year: int):
+    def run_monthly_only(self, year: int, profile: Optional[bool] = None):
         """
         Uruchamia synchronizację tylko kursów miesięcznych.
         """
-        self.manager.sync_monthly_rates(year)
+        self._start_profiling(profile)
+        try:
+            self.manager.run_stage("monthly", self.manager.sync_monthly_rates, year)
+        finally:
+            self._finish_profiling()
 
-    def run_cumulative_only(self, year: int):
+    def run_cumulative_only(self, year: int, profile: Optional[bool] = None):
         """
         Uruchamia synchronizację tylko kursów narastających.
         """
-        self.manager.sync_cumulative_rates(year)
+        self._start_profiling(profile)
+        try:
+            self.manager.run_stage("cumulative", self.manager.sync_cumulative_rates, year)
+        finally:
+            self._finish_profiling()
 
-    def run_sync(self, year: int):
+    def run_sync(self, year: int, profile: Optional[bool] = None):
         """
         Uruchamia synchronizację wszystkich kursów.
         """
         self.logger.log_start(self.config.LOG_STARTING_APP_MSG)
+        self._start_profiling(profile)
         try:
             self.manager.sync_all(year)
             self.logger.log_success(self.config.LOG_FINISHED_APP_SUCCESS_MSG)
         except SystemExit as e:
             self.logger.log_error(self.config.LOG_FINISHED_APP_ERROR_MSG, e)
+        finally:
+            self._finish_profiling()
+
+    def _start_profiling(self, profile: Optional[bool] = None):
+        """
+        Włącza profilowanie etapów, jeśli zażądano go parametrem lub w konfiguracji (PROFILING_ENABLED).
+        """
+        if profile is None:
+            profile = self.config.PROFILING_ENABLED
+        if not profile:
+            return
+        try:
+            self.manager.profiler = StageProfiler(
+                self.config.PROFILE_DIRECTORY,
+                top_allocations=self.config.PROFILE_TOP_ALLOCATIONS,
+                top_functions=self.config.PROFILE_TOP_FUNCTIONS
+            )
+        except OSError as e:
+            self.logger.log_warning(self.config.LOG_PROFILE_START_ERROR_MSG.format(error=e))
+
+    def _finish_profiling(self):
+        """
+        Zapisuje podsumowanie profilowania (jeśli było włączone) i wyłącza profiler.
+        """
+        profiler = self.manager.profiler
+        if profiler is None:
+            return
+        self.manager.profiler = None
+        try:
+            summary_file = profiler.write_summary()
+        except Exception as e:
+            # Błąd profilowania nie może przesłonić wyniku samej synchronizacji
+            self.logger.log_warning(self.config.LOG_PROFILE_SUMMARY_ERROR_MSG.format(error=e))
+            return
+        self.logger.log_success(self.config.LOG_PROFILE_SUMMARY_MSG.format(path=summary_file))
@@ -0,0 +1,200 @@
+import cProfile
+import contextlib
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows – brak modułu resource
+    resource = None
+
+
+class StageProfiler:
+    """
+    Profiluje kolejne etapy synchronizacji (cProfile + tracemalloc).
+
+    Dla każdego etapu zapisuje plik `.pstats`, a po zakończeniu przebiegu
+    plik `summary.json` z czasami, największymi miejscami alokacji pamięci
+    (w punktach kontrolnych etapu) oraz szczytowym RSS procesu.
+    """
+
+    # Ramki pomijane przy raportowaniu alokacji – narzut samego profilowania
+    _IGNORED_FILES = (tracemalloc.__file__, contextlib.__file__, __file__)
+
+    def __init__(self, output_directory: str, top_allocations: int = 10, top_functions: int = 10):
+        """
+        Args:
+            output_directory (str): Katalog bazowy na artefakty profilowania.
+            top_allocations (int): Liczba miejsc alokacji zapisywanych w podsumowaniu.
+            top_functions (int): Liczba funkcji (wg czasu skumulowanego) zapisywanych w podsumowaniu.
+
+        :raises FileExistsError: Jeśli katalog przebiegu już istnieje.
+        """
+        run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{os.getpid()}"
+        self.output_directory = os.path.join(output_directory, run_id)
+        self.top_allocations = top_allocations
+        self.top_functions = top_functions
+        self.stages = []
+        self._baseline = None
+        self._checkpoints = None
+        self._checkpoint_seconds = 0.0
+        self._profile = None
+        os.makedirs(self.output_directory)
+
+    @contextlib.contextmanager
+    def profile_stage(self, name: str):
+        """
+        Kontekst profilujący pojedynczy etap o nazwie `name`.
+
+        Alokacje są raportowane jako różnica względem migawki z początku etapu,
+        więc nie obejmują pamięci zajętej przez wcześniejsze etapy. Czas punktów
+        kontrolnych nie wlicza się do profilu ani do `elapsed_seconds`.
+        """
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.take_snapshot()
+        self._checkpoints = []
+        self._checkpoint_seconds = 0.0
+
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            try:
+                profile.enable()
+                self._profile = profile
+            except ValueError:
+                # Aktywny jest już inny profiler (np. python -m cProfile) – etap bez cProfile
+                profile = None
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            self._profile = None
+            elapsed = time.perf_counter() - start - self._checkpoint_seconds
+
+            # Błędy profilowania nie mogą przesłonić wyjątku z samego etapu
+            try:
+                self.checkpoint("end")
+            except Exception:
+                pass
+            _, traced_peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            checkpoints = self._checkpoints
+            self._baseline = None
+            self._checkpoints = None
+
+            pstats_file = None
+            top_functions = []
+            if profile is not None:
+                pstats_file = os.path.join(self.output_directory, f"{len(self.stages) + 1:02d}_{name}.pstats")
+                try:
+                    profile.dump_stats(pstats_file)
+                except OSError:
+                    pstats_file = None
+                try:
+                    top_functions = self._top_functions(profile)
+                except Exception:
+                    pass
+
+            self.stages.append({
+                "name": name,
+                "elapsed_seconds": round(elapsed, 6),
+                "pstats_file": pstats_file,
+                "traced_peak_bytes": traced_peak,
+                "allocation_checkpoints": checkpoints,
+                "top_functions": top_functions,
+            })
+
+    def checkpoint(self, label: str):
+        """
+        Zapisuje największe miejsca alokacji w bieżącym momencie etapu
+        (np. po wczytaniu danych, przed zapisem do bazy). Poza etapem nic nie robi.
+        """
+        if self._baseline is None:
+            return
+        started = time.perf_counter()
+        profile = self._profile
+        if profile is not None:
+            profile.disable()
+        try:
+            snapshot = tracemalloc.take_snapshot()
+            self._checkpoints.append({
+                "label": label,
+                "top_allocations": self._top_allocations(snapshot, self._baseline),
+            })
+        finally:
+            if profile is not None:
+                profile.enable()
+            self._checkpoint_seconds += time.perf_counter() - started
+
+    def write_summary(self) -> str:
+        """
+        Zapisuje podsumowanie wszystkich etapów do pliku `summary.json`.
+
+        Returns:
+            str: Ścieżka do zapisanego pliku.
+        """
+        summary_file = os.path.join(self.output_directory, "summary.json")
+        summary = {
+            "stages": self.stages,
+            "peak_rss_bytes": self.peak_rss_bytes(),
+        }
+        with open(summary_file, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        return summary_file
+
+    def _top_allocations(self, snapshot: tracemalloc.Snapshot, baseline: tracemalloc.Snapshot) -> list:
+        """
+        Zwraca miejsca alokacji (plik:linia) o największym przyroście pamięci względem `baseline`,
+        z pominięciem ramek samego profilera.
+        """
+        return [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_diff_bytes": stat.size_diff,
+                "count_diff": stat.count_diff,
+            }
+            for stat in snapshot.compare_to(baseline, "lineno")
+            if stat.size_diff > 0 and stat.traceback[0].filename not in self._IGNORED_FILES
+        ][:self.top_allocations]
+
+    def _top_functions(self, profile: cProfile.Profile) -> list:
+        """
+        Zwraca funkcje o największym czasie skumulowanym z profilu cProfile,
+        z pominięciem ramek samego profilera.
+        """
+        stats = pstats.Stats(profile)
+        entries = sorted(
+            (item for item in stats.stats.items() if item[0][0] not in self._IGNORED_FILES),
+            key=lambda item: item[1][3],
+            reverse=True
+        )
+        return [
+            {
+                "function": f"{filename}:{lineno}({func_name})",
+                "calls": primitive_calls,
+                "total_seconds": round(total_time, 6),
+                "cumulative_seconds": round(cumulative_time, 6),
+            }
+            for (filename, lineno, func_name), (primitive_calls, _, total_time, cumulative_time, _)
+            in entries[:self.top_functions]
+        ]
+
+    @staticmethod
+    def peak_rss_bytes():
+        """
+        Zwraca szczytowe zużycie pamięci (RSS) procesu w bajtach lub None, jeśli niedostępne.
+        """
+        if resource is None:
+            return None
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux zwraca wartość w KB, macOS w bajtach
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
@@ -14,12 +14,31 @@ class ExchangeRateManager:
         self.api_client = api_client
         self.csv_loader = csv_loader
         self.saver = saver
+        # Opcjonalny StageProfiler – ustawiany przez Application w trybie profilowania
+        self.profiler = None
+
+    def run_stage(self, name: str, func, *args, **kwargs):
+        """
+        Uruchamia etap synchronizacji, profilując go, jeśli ustawiono profiler.
+        """
+        if self.profiler is None:
+            return func(*args, **kwargs)
+        with self.profiler.profile_stage(name):
+            return func(*args, **kwargs)
+
+    def _checkpoint(self, label: str):
+        """
+        Zapisuje punkt kontrolny alokacji pamięci w bieżącym etapie (tylko w trybie profilowania).
+        """
+        if self.profiler is not None:
+            self.profiler.checkpoint(label)
 
     def sync_daily_rates(self, start_date: str, end_date: str):
         """
         Pobiera dzienne kursy z API NBP i zapisuje je do bazy danych.
         """
         df = self.api_client.get_rates_for_dates(start_date, end_date)
+        self._checkpoint("after_load")
         self.saver.save_daily_rates(df)
 
 
@@ -46,6 +65,7 @@ class ExchangeRateManager:
         Pobiera kursy średnioważone miesięczne z CSV NBP i zapisuje je do bazy danych.
         """
         df = self.csv_loader.load_csv(year, rate_type="monthly")
+        self._checkpoint("after_load")
         self.saver.save_weighted_rates(df, rate_type="monthly")
 
     def sync_cumulative_rates(self, year: int):
@@ -53,12 +73,13 @@ class ExchangeRateManager:
         Pobiera kursy średnioważone narastająco z CSV NBP i zapisuje je do bazy danych.
         """
         df = self.csv_loader.load_csv(year, rate_type="cumulative")
+        self._checkpoint("after_load")
         self.saver.save_weighted_rates(df, rate_type="cumulative")
 
     def sync_all(self, year: int):
         """
         Uruchamia wszystkie procesy synchronizacji: dzienne, miesięczne, narastające.
         """
-        self.sync_daily_rates_auto()
-        self.sync_monthly_rates(year)
-        self.sync_cumulative_rates(year)
+        self.run_stage("daily", self.sync_daily_rates_auto)
+        self.run_stage("monthly", self.sync_monthly_rates, year)
+        self.run_stage("cumulative", self.sync_cumulative_rates, year)
@@ -18,6 +18,7 @@ class Config:
         self.setup_database()
         self.setup_api_nbp()
         self.setup_csv_nbp()
+        self.setup_profiling()
 
     def setup_database(self):
         """
@@ -63,6 +64,29 @@ class Config:
         """
         self.NBP_CSV_BASE_URL = "https://static.nbp.pl/dane/kursy/Archiwum/"
 
+    def setup_profiling(self):
+        """
+        Konfiguruje tryb profilowania synchronizacji (cProfile + tracemalloc).
+        """
+        self.PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+        self.PROFILE_DIRECTORY = os.getenv("PROFILE_DIRECTORY") or os.path.join(
+            os.path.dirname(__file__), "..", "profiles"
+        )
+        self.PROFILE_TOP_ALLOCATIONS = self._get_int_env("PROFILE_TOP_ALLOCATIONS", 10)
+        self.PROFILE_TOP_FUNCTIONS = self._get_int_env("PROFILE_TOP_FUNCTIONS", 10)
+
+    @staticmethod
+    def _get_int_env(name: str, default: int) -> int:
+        """
+        Zwraca dodatnią wartość całkowitą zmiennej środowiskowej lub `default`,
+        jeśli jest pusta, niepoprawna albo mniejsza od 1.
+        """
+        try:
+            value = int(os.getenv(name, default))
+        except ValueError:
+            return default
+        return value if value > 0 else default
+
     def setup_logging(self):
         """Konfiguruje ustawienia logowania."""
         # Ścieżki do plików log
@@ -78,6 +102,10 @@ class Config:
         self.LOG_FINISHED_APP_SUCCESS_MSG = "Application finished successfully."
         self.LOG_FINISHED_APP_ERROR_MSG = ("Application terminated with an error: {error}")
 
+        self.LOG_PROFILE_SUMMARY_MSG = "Profiling summary saved to {path}"
+        self.LOG_PROFILE_START_ERROR_MSG = "Failed to start profiling, continuing without it: {error}"
+        self.LOG_PROFILE_SUMMARY_ERROR_MSG = "Failed to save profiling summary: {error}"
+
         self.LOG_NO_DATA_FOUND_MSG = ("{method_name}: No data found for the given date range.")
 
         # self.LOG_EXTRACTION_STARTED_MSG = "{dataset_name} extraction process started."
@@ -13,3 +13,6 @@ if __name__ == "__main__":
     # app.run_daily_only(start_date, end_date)
     # app.run_monthly_only(year)
     # app.run_cumulative_only(year)
+
+    # Profilowanie (cProfile + tracemalloc) – wyniki w katalogu profiles/:
+    # app.run_sync(year=year, profile=True)
@@ -0,0 +1,44 @@
+from datetime import date
+
+import pandas as pd
+
+
+class StubDbManager:
+    def __init__(self, last_daily_rate_date=None):
+        self.last_daily_rate_date = last_daily_rate_date
+
+    def get_last_daily_rate_date(self):
+        return self.last_daily_rate_date
+
+
+class StubApiClient:
+    def __init__(self):
+        self.calls = []
+
+    def get_rates_for_dates(self, start_date, end_date):
+        self.calls.append((start_date, end_date))
+        return pd.DataFrame({"date": [start_date], "currency_code": ["EUR"], "avg_rate": [4.3]})
+
+
+class StubCsvLoader:
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+
+    def load_csv(self, year, rate_type):
+        self.calls.append((year, rate_type))
+        if self.error is not None:
+            raise self.error
+        return pd.DataFrame({"year": [year], "currency_code": ["EUR"], "rate": [4.3]})
+
+
+class StubSaver:
+    def __init__(self, last_daily_rate_date=None):
+        self.db_manager = StubDbManager(last_daily_rate_date or date.today())
+        self.saved = []
+
+    def save_daily_rates(self, df):
+        self.saved.append(("daily", len(df)))
+
+    def save_weighted_rates(self, df, rate_type):
+        self.saved.append((rate_type, len(df)))
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+# config.settings buduje globalny Config przy imporcie, a ten wymaga DB_PASSWORD
+os.environ.setdefault("DB_PASSWORD", "")
+
+from app.application import Application
+from app.services.exchange_rate_manager import ExchangeRateManager
+from config.settings import Config
+from tests.stubs import StubApiClient, StubCsvLoader, StubSaver
+
+
+class StubLogger:
+    def __init__(self):
+        self.messages = []
+
+    def log_start(self, message):
+        self.messages.append(("start", message))
+
+    def log_success(self, message):
+        self.messages.append(("success", message))
+
+    def log_warning(self, message):
+        self.messages.append(("warning", message))
+
+    def log_error(self, message, error):
+        self.messages.append(("error", message.format(error=error)))
+
+
+class ApplicationProfilingTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        # Bez Application.__init__ – nie tworzymy połączenia z bazą ani plików logów
+        self.app = Application.__new__(Application)
+        self.app.config = Config()
+        self.app.config.PROFILE_DIRECTORY = self._tmp.name
+        self.app.logger = StubLogger()
+        self.app.manager = ExchangeRateManager(
+            api_client=StubApiClient(),
+            csv_loader=StubCsvLoader(),
+            saver=StubSaver()
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _summary_files(self):
+        return [
+            os.path.join(root, filename)
+            for root, _, filenames in os.walk(self._tmp.name)
+            for filename in filenames
+            if filename == "summary.json"
+        ]
+
+    def test_failing_stage_still_writes_summary_and_clears_profiler(self):
+        self.app.manager.csv_loader = StubCsvLoader(error=RuntimeError("csv unavailable"))
+
+        with self.assertRaises(RuntimeError):
+            self.app.run_monthly_only(2025, profile=True)
+
+        self.assertIsNone(self.app.manager.profiler)
+        self.assertEqual(len(self._summary_files()), 1)
+
+    def test_profile_none_falls_back_to_config(self):
+        self.app.config.PROFILING_ENABLED = False
+        self.app.run_cumulative_only(2025)
+        self.assertEqual(self._summary_files(), [])
+
+        self.app.config.PROFILING_ENABLED = True
+        self.app.run_cumulative_only(2025)
+        self.assertEqual(len(self._summary_files()), 1)
+
+    def test_explicit_profile_overrides_config(self):
+        self.app.config.PROFILING_ENABLED = True
+        self.app.run_cumulative_only(2025, profile=False)
+        self.assertEqual(self._summary_files(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
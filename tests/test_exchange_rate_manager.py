@@ -0,0 +1,46 @@
+import tempfile
+import unittest
+
+from app.profiler import StageProfiler
+from app.services.exchange_rate_manager import ExchangeRateManager
+from tests.stubs import StubApiClient, StubCsvLoader, StubSaver
+
+
+class ExchangeRateManagerProfilingTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.manager = ExchangeRateManager(
+            api_client=StubApiClient(),
+            csv_loader=StubCsvLoader(),
+            saver=StubSaver()
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_run_stage_without_profiler_calls_stage_directly(self):
+        calls = []
+
+        def stage(*args, **kwargs):
+            calls.append((args, kwargs))
+            return "result"
+
+        self.assertIsNone(self.manager.profiler)
+        self.assertEqual(self.manager.run_stage("daily", stage, 1, key="value"), "result")
+        self.assertEqual(calls, [((1,), {"key": "value"})])
+
+    def test_sync_all_profiles_each_stage(self):
+        profiler = StageProfiler(self._tmp.name)
+        self.manager.profiler = profiler
+
+        self.manager.sync_all(2025)
+
+        self.assertEqual([stage["name"] for stage in profiler.stages], ["daily", "monthly", "cumulative"])
+        self.assertEqual(self.manager.saver.saved, [("monthly", 1), ("cumulative", 1)])
+        monthly_labels = [checkpoint["label"] for checkpoint in profiler.stages[1]["allocation_checkpoints"]]
+        self.assertEqual(monthly_labels, ["after_load", "end"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+from unittest import mock
+
+from app.profiler import StageProfiler
+
+
+class StageProfilerTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output_directory = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_writes_pstats_and_summary(self):
+        profiler = StageProfiler(self.output_directory, top_allocations=5, top_functions=5)
+        with profiler.profile_stage("monthly"):
+            data = [str(i) * 10 for i in range(10000)]
+            profiler.checkpoint("after_load")
+            del data
+
+        self.assertTrue(os.path.isfile(os.path.join(profiler.output_directory, "01_monthly.pstats")))
+
+        with open(profiler.write_summary(), encoding="utf-8") as f:
+            summary = json.load(f)
+
+        self.assertIn("peak_rss_bytes", summary)
+        stage = summary["stages"][0]
+        self.assertEqual(stage["name"], "monthly")
+        for key in ("elapsed_seconds", "pstats_file", "traced_peak_bytes",
+                    "allocation_checkpoints", "top_functions"):
+            self.assertIn(key, stage)
+        self.assertNotIn("peak_rss_bytes", stage)
+
+        labels = [checkpoint["label"] for checkpoint in stage["allocation_checkpoints"]]
+        self.assertEqual(labels, ["after_load", "end"])
+        # Dane zwolnione przed końcem etapu są widoczne w punkcie kontrolnym
+        top_location = stage["allocation_checkpoints"][0]["top_allocations"][0]["location"]
+        self.assertTrue(top_location.startswith(__file__))
+
+    def test_stage_runs_unprofiled_when_another_profiler_is_active(self):
+        profiler = StageProfiler(self.output_directory)
+        calls = []
+        was_tracing = tracemalloc.is_tracing()
+        with mock.patch("cProfile.Profile.enable", side_effect=ValueError("another profiler is active")):
+            with profiler.profile_stage("daily"):
+                calls.append("daily")
+
+        self.assertEqual(calls, ["daily"])
+        self.assertEqual(tracemalloc.is_tracing(), was_tracing)
+        stage = profiler.stages[0]
+        self.assertIsNone(stage["pstats_file"])
+        self.assertEqual(stage["top_functions"], [])
+
+    def test_runs_in_same_second_use_separate_directories(self):
+        first = StageProfiler(self.output_directory)
+        second = StageProfiler(self.output_directory)
+
+        self.assertNotEqual(first.output_directory, second.output_directory)
+
+
+if __name__ == "__main__":
+    unittest.main()